@@ -0,0 +1,247 @@
+"""
+Render driver for all the Manim scenes in this folder
+
+Instead of running `manim -pqh <file> <Scene>` for each scene by hand,
+this script finds every `Scene` subclass in the `manim/` folder and
+renders them in parallel (one process per core by default).
+
+A scene is skipped when nothing it depends on has changed: we hash the
+scene's own source file plus any local modules it imports, and keep a
+small cache (media/render_cache.json) of those hashes together with a
+hash of the rendered video. If the sources match and the video on disk
+is still the one we rendered, there is nothing to do.
+
+At the end, the time each scene took is printed so the expensive
+animations are easy to spot.
+
+To render everything, run the following command:
+(Activate your conda environment first)
+
+For 1080p quality:
+python render_scenes.py -q h
+
+For 720p quality:
+python render_scenes.py -q m
+
+Other options:
+python render_scenes.py --force            # ignore the cache
+python render_scenes.py --jobs 2           # limit the number of processes
+python render_scenes.py BPEScene           # only render some scenes
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+SCENES_DIR = Path(__file__).resolve().parent
+MEDIA_DIR = SCENES_DIR / "media"
+CACHE_FILE = MEDIA_DIR / "render_cache.json"
+
+# manim quality flag -> folder name manim writes the video into
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+
+def hash_file(path):
+    """sha256 of a file's content, read in chunks so big videos are fine"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_scenes(scenes_dir=SCENES_DIR):
+    """
+    Return a list of (scene_file, scene_name) for every Scene subclass.
+
+    We parse the files with `ast` instead of importing them, so discovery
+    doesn't need manim installed and doesn't run any scene code.
+    A class counts as a scene if it inherits from `Scene` (or any manim
+    `*Scene` base like `MovingCameraScene`), or from another scene we found.
+    """
+    scenes = []
+    for path in sorted(scenes_dir.glob("*.py")):
+        if path.resolve() == Path(__file__).resolve():
+            continue
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        scene_names = set()
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [ast.unparse(base).split(".")[-1] for base in node.bases]
+            if any(b.endswith("Scene") or b in scene_names for b in bases):
+                scene_names.add(node.name)
+                scenes.append((path, node.name))
+    return scenes
+
+
+def local_dependencies(path, scenes_dir=SCENES_DIR, seen=None):
+    """
+    The scene file plus every module in `scenes_dir` it imports (recursively).
+
+    Only local imports matter here, `from manim import *` and numpy are
+    not tracked since they don't change when we edit a scene.
+    """
+    if seen is None:
+        seen = set()
+    path = path.resolve()
+    if path in seen:
+        return seen
+    seen.add(path)
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            candidate = scenes_dir / (module.replace(".", "/") + ".py")
+            if candidate.exists():
+                local_dependencies(candidate, scenes_dir, seen)
+    return seen
+
+
+def source_hash(path):
+    """One hash for the scene file and all the local files it imports"""
+    digest = hashlib.sha256()
+    for dep in sorted(local_dependencies(path)):
+        digest.update(str(dep.relative_to(SCENES_DIR)).encode())
+        digest.update(hash_file(dep).encode())
+    return digest.hexdigest()
+
+
+def output_path(scene_file, scene_name, quality):
+    """Where manim puts the final video, e.g. media/videos/bpe_scene/1080p60/BPEScene.mp4"""
+    return MEDIA_DIR / "videos" / scene_file.stem / QUALITY_DIRS[quality] / f"{scene_name}.mp4"
+
+
+def load_cache():
+    if CACHE_FILE.exists():
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_cache(cache):
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def is_up_to_date(entry, src_hash, video):
+    """True if sources are unchanged and the video on disk is the one we rendered"""
+    if not entry or entry.get("source_hash") != src_hash:
+        return False
+    if not video.exists():
+        return False
+    return entry.get("output_hash") == hash_file(video)
+
+
+def render_scene(scene_file, scene_name, quality):
+    """
+    Render one scene with the manim CLI (runs inside a worker process).
+
+    Returns (scene_name, seconds, returncode, stderr). Manim's own output
+    is captured so the parallel renders don't interleave in the terminal.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "manim",
+            f"-q{quality}",
+            "--media_dir", str(MEDIA_DIR),
+            str(scene_file), scene_name,
+        ],
+        cwd=SCENES_DIR,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    return scene_name, elapsed, result.returncode, result.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all Manim scenes in parallel, skipping unchanged ones.")
+    parser.add_argument("scenes", nargs="*", help="only render these scene names (default: all)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="h", help="manim quality flag (default: h)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes (default: number of cores)")
+    parser.add_argument("-f", "--force", action="store_true", help="re-render even if the cache says a scene is up to date")
+    args = parser.parse_args()
+
+    scenes = find_scenes()
+    if args.scenes:
+        unknown = set(args.scenes) - {name for _, name in scenes}
+        if unknown:
+            parser.error(f"unknown scene(s): {', '.join(sorted(unknown))}")
+        scenes = [(f, name) for f, name in scenes if name in args.scenes]
+
+    cache = load_cache()
+    todo = []
+    for scene_file, scene_name in scenes:
+        key = f"{scene_file.name}:{scene_name}:{args.quality}"
+        src_hash = source_hash(scene_file)
+        video = output_path(scene_file, scene_name, args.quality)
+        if not args.force and is_up_to_date(cache.get(key), src_hash, video):
+            print(f"[skip]   {scene_name} (unchanged)")
+            continue
+        todo.append((key, scene_file, scene_name, src_hash, video))
+
+    if not todo:
+        print("Everything is up to date.")
+        return 0
+
+    jobs = max(1, min(args.jobs, len(todo)))
+    print(f"Rendering {len(todo)} scene(s) with {jobs} process(es)...")
+
+    timings = {}
+    failed = []
+    total_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(render_scene, scene_file, scene_name, args.quality): (key, scene_name, src_hash, video)
+            for key, scene_file, scene_name, src_hash, video in todo
+        }
+        for future in as_completed(futures):
+            key, scene_name, src_hash, video = futures[future]
+            _, elapsed, returncode, stderr = future.result()
+            timings[scene_name] = elapsed
+            if returncode != 0 or not video.exists():
+                failed.append(scene_name)
+                print(f"[failed] {scene_name} after {elapsed:.1f}s")
+                print(stderr.strip()[-2000:])
+                continue
+            # only cache successful renders, and save right away so a
+            # crash halfway through doesn't lose the finished ones
+            cache[key] = {"source_hash": src_hash, "output_hash": hash_file(video)}
+            save_cache(cache)
+            print(f"[done]   {scene_name} in {elapsed:.1f}s")
+    total = time.perf_counter() - total_start
+
+    # slowest first, so the expensive animations are at the top
+    print("\nRender times:")
+    for scene_name, elapsed in sorted(timings.items(), key=lambda kv: kv[1], reverse=True):
+        status = "FAILED" if scene_name in failed else "ok"
+        print(f"  {scene_name:<30} {elapsed:8.1f}s  {status}")
+    print(f"  {'total (wall clock)':<30} {total:8.1f}s")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())